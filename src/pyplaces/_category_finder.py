@@ -1,8 +1,39 @@
-import re
-import math
+import os
+import hashlib
+from pathlib import Path
 from typing import List, Dict, Union
-from pandas import notna, DataFrame
-from sentence_transformers import SentenceTransformer
+import numpy as np
+from pandas import DataFrame
+
+# Static token-embedding model: category names are only a few words long,
+# so a transformer forward pass buys little over mean-pooled embeddings
+SEMANTIC_MODEL_NAME = 'sentence-transformers/static-retrieval-mrl-en-v1'
+
+# Category embeddings are cached here between sessions
+CACHE_DIR = Path(os.environ.get("PYPLACES_CACHE_DIR", Path.home() / ".cache" / "pyplaces"))
+
+# Match columns dropped when ids are hidden from the user
+_HIDDEN_COLS = ['category_id']
+
+# Thread limits users set deliberately (e.g. on shared or HPC machines), which must be respected
+_THREAD_LIMIT_VARS = ("OMP_NUM_THREADS", "MKL_NUM_THREADS")
+
+def _configure_torch_threads(torch):
+    """Set PyTorch thread counts from PYPLACES_TORCH_THREADS, or raise a single-thread default nobody asked for."""
+    num_threads = os.environ.get("PYPLACES_TORCH_THREADS")
+    if num_threads:
+        torch.set_num_threads(int(num_threads))
+    elif any(os.environ.get(var) for var in _THREAD_LIMIT_VARS):
+        return
+    elif torch.get_num_threads() == 1:
+        torch.set_num_threads(max(1, (os.cpu_count() or 1) // 2))
+    else:
+        return
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # interop threads can only be set before any parallel work has started
+        pass
 
 class CategoryFinder:
     """
@@ -15,11 +46,26 @@ class CategoryFinder:
         self.batch_size = batch_size
         self.processed = False
         
-        # Initialize semantic model
-        
-        self.semantic_model = SentenceTransformer('all-mpnet-base-v2')
-        self.semantic_vectors = []
+        # Semantic model is loaded on first use
+        self._semantic_model = None
+        self.semantic_matrix = None
+        self._categories_by_id = None
     
+    @property
+    def semantic_model(self):
+        """
+        SentenceTransformer model, loaded and cached on first access.
+        
+        If PyTorch defaults to a single thread without OMP_NUM_THREADS or MKL_NUM_THREADS
+        being set, the intra-op thread count is raised to half the CPU count. Set the
+        PYPLACES_TORCH_THREADS environment variable to choose the thread count explicitly.
+        """
+        if self._semantic_model is None:
+            import torch
+            from sentence_transformers import SentenceTransformer
+            _configure_torch_threads(torch)
+            self._semantic_model = SentenceTransformer(SEMANTIC_MODEL_NAME)
+        return self._semantic_model
     
     def load_data(self, data: DataFrame):
         """
@@ -38,8 +84,11 @@ class CategoryFinder:
         self.categories_df.columns = [col.strip() for col in self.categories_df.columns]
         
         # Create cleaned category names
-        self.categories_df['category_name_clean'] = self.categories_df['category_name'].fillna('').apply(
-            lambda x: re.sub(r'\s+', ' ', x.lower()).strip()
+        self.categories_df['category_name_clean'] = (
+            self.categories_df['category_name'].fillna('')
+            .str.lower()
+            .str.replace(r'\s+', ' ', regex=True)
+            .str.strip()
         )
         
         return self
@@ -56,51 +105,89 @@ class CategoryFinder:
         if self.categories_df is None:
             raise ValueError("Data must be loaded before processing. Use load_data() first.")
         
-        # Process semantic embeddings
+        # Process semantic embeddings, letting the model handle batching
         texts_to_embed = self.categories_df['category_name_clean'].tolist()
         
-        self.semantic_vectors = []
-        for start_idx in range(0, len(texts_to_embed), self.batch_size):
-            end_idx = min(start_idx + self.batch_size, len(texts_to_embed))
-            batch_texts = texts_to_embed[start_idx:end_idx]
-            batch_vectors = self.semantic_model.encode(batch_texts)
-            self.semantic_vectors.extend(batch_vectors)
+        # embeddings are cached on disk in float16, but kept in float32 so queries are a plain matvec
+        cache_path = self._embeddings_cache_path(texts_to_embed)
+        try:
+            with np.load(cache_path) as cached:
+                self.semantic_matrix = cached["semantic_matrix"].astype(np.float32)
+        except Exception:
+            self.semantic_matrix = self.semantic_model.encode(
+                texts_to_embed,
+                batch_size=self.batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            ).astype(np.float32)
+            self._save_embeddings_cache(cache_path)
         
         self._create_lookup_tables()
         
         self.processed = True
         return self
     
-    def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        
-        # Calculate the magnitudes
-        mag1 = math.sqrt(sum(a * a for a in vec1))
-        mag2 = math.sqrt(sum(b * b for b in vec2))
-        
-        if mag1 == 0 or mag2 == 0:
-            return 0
-        
-        # Return cosine similarity
-        return dot_product / (mag1 * mag2)
-        
+    def _embeddings_cache_path(self, texts: List[str]) -> Path:
+        # Fingerprint the model and the exact category names so a new release re-embeds
+        digest = hashlib.sha1(SEMANTIC_MODEL_NAME.encode("utf-8"))
+        for text in texts:
+            digest.update(text.encode("utf-8") + b"\n")
+        return CACHE_DIR / f"categories_{digest.hexdigest()[:16]}.npz"
+    
+    def _save_embeddings_cache(self, cache_path: Path):
+        # Write to a temporary file first so concurrent readers never see a partial file
+        tmp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                np.savez(f, semantic_matrix=self.semantic_matrix.astype(np.float16))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Caching is best effort, e.g. on a read-only home directory
+            tmp_path.unlink(missing_ok=True)
+    
     def _create_lookup_tables(self):
-        self.category_name_lookup = {
-            name.lower(): idx for idx, name in 
-            enumerate(self.categories_df['category_name_clean'])
-        }
+        # category_name_clean is already lowercased by load_data
+        self.category_name_lookup = dict(zip(
+            self.categories_df['category_name_clean'].to_numpy(), range(len(self.categories_df))
+        ))
+        
+        # indexed copy for _remove_redundant_children, built on first use
+        self._categories_by_id = None
+        
+        # Column arrays for building match records without per-row Series lookups
+        num_rows = len(self.categories_df)
+        self._cat_ids = self.categories_df['category_id'].to_numpy()
+        self._cat_names = self.categories_df['category_name'].to_numpy()
+        if 'category_label' in self.categories_df.columns:
+            self._cat_labels = self.categories_df['category_label'].to_numpy()
+        else:
+            self._cat_labels = np.full(num_rows, '', dtype=object)
+        if 'category_level' in self.categories_df.columns:
+            self._cat_levels = self.categories_df['category_level'].fillna(0).astype(int).to_numpy()
+        else:
+            self._cat_levels = np.zeros(num_rows, dtype=int)
         
         self.parent_child_map = {}
         for i in range(1, 6): 
             parent_id_col = f'level{i}_category_id'
             if parent_id_col in self.categories_df.columns:
-                for _, row in self.categories_df.iterrows():
-                    if notna(row.get(parent_id_col)):
-                        parent_id = row[parent_id_col]
-                        if parent_id not in self.parent_child_map:
-                            self.parent_child_map[parent_id] = []
-                        if notna(row.get('category_id')):
-                            self.parent_child_map[parent_id].append(row['category_id'])
+                parent_ids = self.categories_df[parent_id_col].dropna()
+                pairs = self.categories_df.loc[parent_ids.index, [parent_id_col, 'category_id']].dropna()
+                children = pairs.groupby(parent_id_col, sort=False)['category_id'].apply(list).to_dict()
+                for parent_id in parent_ids.unique():
+                    self.parent_child_map.setdefault(parent_id, []).extend(children.get(parent_id, []))
+    
+    def _match_record(self, idx: int, score: float, match_type: str) -> Dict:
+        return {
+            'category_id': self._cat_ids[idx],
+            'category_name': self._cat_names[idx],
+            'category_label': self._cat_labels[idx],
+            'similarity_score': score,
+            'category_level': int(self._cat_levels[idx]),
+            'match_type': match_type
+        }
     
     def _find_categories(self, query: str, top_n: int = 5, threshold: float = 0.3, 
                         exact_match: bool = False) -> List[Dict]:
@@ -110,53 +197,48 @@ class CategoryFinder:
         query = query.lower().strip()
         
         exact_matches = []
+        exact_indices = []
         normalized_query = query
         
         
         if normalized_query in self.category_name_lookup:
             idx = self.category_name_lookup[normalized_query]
-            category = self.categories_df.iloc[idx]
-            exact_matches.append({
-                'category_id': category.get('category_id'),
-                'category_name': category.get('category_name'),
-                'category_label': category.get('category_label', ''),
-                'similarity_score': 1.0,  # Perfect match
-                'category_level': int(category.get('category_level', 0)),
-                'match_type': 'exact'
-            })
+            exact_matches.append(self._match_record(idx, 1.0, 'exact'))  # Perfect match
+            exact_indices.append(idx)
         
         
         if exact_matches and exact_match:
             return exact_matches
+        
+        # Skip the model forward pass when the exact hit already fills the results
+        if len(exact_matches) >= top_n:
+            return exact_matches[:top_n]
             
         
         results = exact_matches.copy()
-        added_indices = {self.category_name_lookup.get(m['category_name'].lower(), -1) for m in exact_matches}
         
         # Create semantic vector for query
-        query_semantic = self.semantic_model.encode([query])[0]
+        query_semantic = self.semantic_model.encode([query], convert_to_numpy=True, normalize_embeddings=True)[0]
         
+        # Cosine similarity against every category in one matrix-vector product
+        semantic_similarities = self.semantic_matrix @ query_semantic.astype(np.float32)
         
-        semantic_similarities = [self._cosine_similarity(query_semantic, vec) for vec in self.semantic_vectors]
+        # Exact matches are already in the results, so rule them out of the ranking
+        semantic_similarities[exact_indices] = -np.inf
         
-        similarity_pairs = [(idx, score) for idx, score in enumerate(semantic_similarities)]
-        similarity_pairs.sort(key=lambda x: x[1], reverse=True)
+        # Select the remaining top-k in O(N), then sort only those k
+        k = min(top_n - len(results), len(semantic_similarities))
+        if k > 0:
+            candidates = np.argpartition(-semantic_similarities, k - 1)[:k]
+            candidates = candidates[np.argsort(-semantic_similarities[candidates])]
+        else:
+            candidates = []
         
-        for idx, score in similarity_pairs:
-            if len(results) >= top_n:
-                break
-                
-            if score >= threshold and idx not in added_indices:
-                added_indices.add(idx)
-                category = self.categories_df.iloc[idx]
-                results.append({
-                    'category_id': category.get('category_id'),
-                    'category_name': category.get('category_name'),
-                    'category_label': category.get('category_label', ''),
-                    'similarity_score': float(score),
-                    'category_level': int(category.get('category_level', 0)),
-                    'match_type': 'semantic'
-                })
+        for idx in candidates:
+            idx = int(idx)
+            score = semantic_similarities[idx]
+            if score >= threshold:
+                results.append(self._match_record(idx, float(score), 'semantic'))
                 
         return sorted(results, key=lambda x: x['similarity_score'], reverse=True)
     
@@ -186,9 +268,16 @@ class CategoryFinder:
         matches = self._find_categories(query, top_n=top_n, exact_match=exact_match)
         
         # matches = self._remove_redundant_children(matches)
+        
+        # Only build a DataFrame when it is returned or printed
+        if not as_df and not show_name_and_id:
+            if list_return == "name":
+                return [item['category_name'] for item in matches]
+            return [item['category_id'] for item in matches]
+        
         df = DataFrame(matches)
         if hide_ids:
-            df = df[df.columns.drop(list(df.filter(regex='category_id')))]
+            df = df.drop(columns=_HIDDEN_COLS, errors='ignore')
         
         if show_name_and_id:
             if verbose:
@@ -206,22 +295,22 @@ class CategoryFinder:
         if not categories or len(categories) <= 1:
             return categories
             
-        category_ids = {cat['category_id'] for cat in categories}
+        if self._categories_by_id is None:
+            self._categories_by_id = self.categories_df.drop_duplicates('category_id').set_index('category_id')
+        categories_by_id = self._categories_by_id
         
-        children_to_remove = set()
+        ids = [cat['category_id'] for cat in categories]
+        category_ids = set(ids)
+        levels = np.array([cat.get('category_level', 0) for cat in categories])
+        
+        parent_levels = [i for i in range(1, int(levels.max())) 
+                            if f'level{i}_category_id' in categories_by_id.columns]
+        if not parent_levels:
+            return categories
+        
+        # A category is redundant if one of its ancestors (above its own level) is also in the results
+        rows = categories_by_id.reindex(ids)[[f'level{i}_category_id' for i in parent_levels]]
+        is_ancestor = rows.isin(category_ids).to_numpy() & (np.array(parent_levels)[None, :] < levels[:, None])
+        children_to_remove = {ids[i] for i in np.flatnonzero(is_ancestor.any(axis=1))}
         
-        for category in categories:
-            level = category.get('category_level', 0)
-            category_id = category.get('category_id')
-            
-            for i in range(1, level):
-                parent_level_col = f'level{i}_category_id'
-                if parent_level_col in self.categories_df.columns:
-                    cat_row = self.categories_df[self.categories_df['category_id'] == category_id]
-                    if not cat_row.empty and parent_level_col in cat_row.columns:
-                        parent_id = cat_row.iloc[0][parent_level_col]
-                        # If the parent is in our results, mark this child for removal
-                        if parent_id in category_ids:
-                            children_to_remove.add(category_id)
-                            break
         return [cat for cat in categories if cat['category_id'] not in children_to_remove]
\ No newline at end of file
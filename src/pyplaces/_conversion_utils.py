@@ -2,6 +2,17 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+
+_CONVERSION_FACTORS = MappingProxyType({
+    "m": 1.0,          # meters
+    "km": 1000.0,      # kilometers to meters
+    "in": 0.0254,      # inches to meters
+    "ft": 0.3048,      # feet to meters
+    "yd": 0.9144,      # yards to meters
+    "mi": 1609.34,     # miles to meters
+})
+
 def convert_to_meters(value: float, unit: str) -> float:
     """
     Convert a value from the specified unit to meters.
@@ -23,16 +34,7 @@ def convert_to_meters(value: float, unit: str) -> float:
     ValueError
         If the unit is not recognized
     """
-    conversion_factors = {
-        "m": 1,          # meters
-        "km": 1000,      # kilometers to meters
-        "in": 0.0254,    # inches to meters
-        "ft": 0.3048,    # feet to meters
-        "yd": 0.9144,    # yards to meters
-        "mi": 1609.34,   # miles to meters
-    }
-    
-    if unit not in conversion_factors:
-        raise ValueError(f"Invalid unit: {unit}. Valid units: m, km, in, ft, yd, mi")
-    
-    return value * conversion_factors[unit]
\ No newline at end of file
+    try:
+        return value * _CONVERSION_FACTORS[unit]
+    except KeyError:
+        raise ValueError(f"Invalid unit: {unit}. Valid units: m, km, in, ft, yd, mi") from None
\ No newline at end of file
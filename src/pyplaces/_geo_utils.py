@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+import numpy as np
 from pyproj import Geod
-from shapely import Polygon
+from shapely import Polygon, box, intersects, intersection, bounds
 from ._conversion_utils import convert_to_meters
-from osmnx.geocoder import geocode, geocode_to_gdf
-from osmnx import settings
 
-# Set OSMNX settings
-settings.http_referer = "pyplaces Python Package" 
-settings.http_user_agent = "pyplaces"
+# Point buffers are 64-gon approximations on the WGS84 ellipsoid, going counter-clockwise from north
+BUFFER_VERTICES = 64
+_GEOD_WGS84 = Geod(ellps='WGS84')
+_BUFFER_AZIMUTHS = np.linspace(360, 0, BUFFER_VERTICES, endpoint=False)
 
 def point_buffer(lon: float, lat: float, radius_m: float) -> Polygon:
     """
@@ -31,22 +32,73 @@ def point_buffer(lon: float, lat: float, radius_m: float) -> Polygon:
         Polygon representing the buffer
     """
     
-    geod = Geod(ellps='WGS84')
-    num_vtxs = 64
+    lons, lats = _buffer_vertices(lon, lat, radius_m)
     
-    angles = []
-    for i in range(num_vtxs):
-        angle = 360 - (i * 360 / num_vtxs)
-        angles.append(angle)
+    # Create a polygon from the coordinates
+    return Polygon(np.column_stack([lons, lats]))
+
+def _buffer_vertices(lon: float, lat: float, radius_m: float) -> tuple[np.ndarray, np.ndarray]:
+    """Longitudes and latitudes of the point buffer's vertices."""
+    # Forward-solve all vertices in one call; pyproj needs equal-length arrays, so only the
+    # per-call values are filled and the azimuth ramp is reused
+    lons, lats, _ = _GEOD_WGS84.fwd(np.full(BUFFER_VERTICES, lon), np.full(BUFFER_VERTICES, lat),
+                                    _BUFFER_AZIMUTHS, np.full(BUFFER_VERTICES, radius_m), radians=False)
+    return lons, lats
+
+def geometry_tiles(geometry, grid_size: int = 8) -> list[tuple[float, float, float, float]]:
+    """
+    Cover a geometry with the bounding boxes of its pieces on a regular grid.
     
-    coords = []
-    for angle in angles:
-        # Calculate a single point - geod.fwd returns lon, lat, az for a single point
-        fwd_lon, fwd_lat, _ = geod.fwd(lon, lat, angle, radius_m, radians=False)
-        coords.append((fwd_lon, fwd_lat))
+    Parameters:
+    -----------
+    geometry : shapely.Geometry
+        Area to cover, e.g. a geocoded place boundary
+    grid_size : int, default 8
+        Number of grid cells along each axis of the geometry's bounds
+        
+    Returns:
+    --------
+    list
+        Bounding boxes as (minx, miny, maxx, maxy), together covering the geometry
+    """
+    minx, miny, maxx, maxy = geometry.bounds
+    if geometry.area == 0:
+        return [(minx, miny, maxx, maxy)]
     
-    # Create a polygon from the coordinates
-    return Polygon(coords)
+    xs = np.linspace(minx, maxx, grid_size + 1)
+    ys = np.linspace(miny, maxy, grid_size + 1)
+    x0, y0 = np.meshgrid(xs[:-1], ys[:-1])
+    x1, y1 = np.meshgrid(xs[1:], ys[1:])
+    cells = box(x0.ravel(), y0.ravel(), x1.ravel(), y1.ravel())
+    
+    # keep the cells touching the geometry, shrunk to the part of the geometry inside them
+    cells = cells[intersects(cells, geometry)]
+    tiles = bounds(intersection(cells, geometry))
+    return [tuple(tile) for tile in tiles[~np.isnan(tiles[:, 0])].tolist()]
+
+@lru_cache(maxsize=1)
+def _geocoder():
+    """osmnx's geocoder module, imported and configured on first use since osmnx takes about a second to import."""
+    from osmnx import geocoder, settings
+    
+    # Set OSMNX settings
+    settings.http_referer = "pyplaces Python Package" 
+    settings.http_user_agent = "pyplaces"
+    return geocoder
+
+@lru_cache(maxsize=1024)
+def _geocode_cached(address: str) -> tuple[float, float]:
+    """Geocode an address to a (lat, lon) point, memoized per address string."""
+    return _geocoder().geocode(address)
+
+@lru_cache(maxsize=1024)
+def _geocode_place_cached(address: str):
+    """Geocode a place to its (geometry, bbox), memoized per place string."""
+    gdf = _geocoder().geocode_to_gdf(query=address, which_result=1, by_osmid=False)
+    row = gdf.iloc[0]
+    geometry = row["geometry"]
+    bbox = (row["bbox_west"], row["bbox_south"], row["bbox_east"], row["bbox_north"])
+    return geometry, bbox
 
 def geocode_point_to_bbox(address: str, distance: float, unit: str):
     """
@@ -67,12 +119,13 @@ def geocode_point_to_bbox(address: str, distance: float, unit: str):
         Bounding box as (minx, miny, maxx, maxy)
     """
     if isinstance(address, str):
-        point = geocode(address)
+        point = _geocode_cached(address)
     else:
         point = address
     distance = convert_to_meters(distance, unit)
-    bbox = point_buffer(point[1], point[0], distance).bounds
-    return bbox
+    # only the bounds are used, so take them from the vertices without building a polygon
+    lons, lats = _buffer_vertices(point[1], point[0], distance)
+    return (float(lons.min()), float(lats.min()), float(lons.max()), float(lats.max()))
 
 def geocode_place_to_bbox(address: str):
     """
@@ -87,8 +140,4 @@ def geocode_place_to_bbox(address: str):
     tuple
         (geometry, bbox) where bbox is (minx, miny, maxx, maxy)
     """
-    gdf = geocode_to_gdf(query=address, which_result=1, by_osmid=False)
-    row = gdf.iloc[0]
-    geometry = row["geometry"]
-    bbox = (row["bbox_west"], row["bbox_south"], row["bbox_east"], row["bbox_north"])
-    return geometry, bbox
\ No newline at end of file
+    return _geocode_place_cached(address)
\ No newline at end of file
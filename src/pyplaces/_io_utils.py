@@ -2,18 +2,142 @@
 
 from __future__ import annotations
 from json import loads
-import sys
+from functools import lru_cache, reduce
+from operator import or_
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
 
-from pyarrow import RecordBatchReader
-from pyarrow.compute import field
-from pyarrow.dataset import dataset
-from pyarrow.fs import S3FileSystem
+import numpy as np
+from pyarrow import Table, concat_tables, CacheOptions, schema, Schema, io_thread_count, set_io_thread_count
+from pyarrow.compute import field, Expression
+from pyarrow.dataset import dataset, Dataset, FileSystemDataset, ParquetFragmentScanOptions
+from pyarrow.fs import S3FileSystem, S3LogLevel, initialize_s3
+from pyarrow.lib import ArrowInvalid
 from geopandas import GeoDataFrame
+from pandas import concat
+from shapely import STRtree, from_wkb
 
-from ._utils import evaluate_filter_structure, catch_column_filter_error, FilterStructure
-from ._geo_utils import geocode_place_to_bbox, geocode_point_to_bbox
+from ._utils import (
+    compile_filter_structure, split_filter_structure, filter_structure_columns,
+    column_filter_errors, FilterStructure
+)
+from ._geo_utils import geocode_place_to_bbox, geocode_point_to_bbox, geometry_tiles
 from ._errors import S3ReadError
 
+logger = logging.getLogger(__name__)
+
+# S3 reads are latency-bound, so allow more concurrent range requests than Arrow's default of 8.
+# Setting the ARROW_IO_THREADS environment variable keeps Arrow's own choice instead.
+if "ARROW_IO_THREADS" not in os.environ:
+    set_io_thread_count(max(io_thread_count(), min(16, (os.cpu_count() or 4) * 2)))
+
+try:
+    initialize_s3(S3LogLevel.Off)
+except ArrowInvalid:
+    # already initialized by another S3FileSystem user, which is fine
+    pass
+
+# Fail fast on stalled connections rather than waiting on the SDK's defaults
+S3_CONNECT_TIMEOUT = 5
+S3_REQUEST_TIMEOUT = 30
+
+# Coalesce nearby column-chunk ranges into fewer, larger GETs and prefetch them in the background
+PARQUET_SCAN_OPTIONS = ParquetFragmentScanOptions(
+    pre_buffer=True,
+    cache_options=CacheOptions(hole_size_limit=8 << 20, range_size_limit=32 << 20)
+)
+BATCH_READAHEAD = 16
+FRAGMENT_READAHEAD = 4
+# bbox reads scan one fragment per row group, so fragment readahead bounds concurrent row-group fetches
+MAX_CONCURRENT_ROW_GROUPS = 8
+
+# bbox struct field references, built once rather than on every read
+_BBOX_XMIN = field("bbox", "xmin")
+_BBOX_XMAX = field("bbox", "xmax")
+_BBOX_YMIN = field("bbox", "ymin")
+_BBOX_YMAX = field("bbox", "ymax")
+
+@lru_cache(maxsize=1024)
+def _bbox_filter(bbox: tuple[float,float,float,float], inclusive: bool = False) -> Expression:
+    """Expression matching rows whose bbox column intersects the given box, built once per box."""
+    xmin, ymin, xmax, ymax = bbox
+    if inclusive:
+        return (_BBOX_XMIN <= xmax) & (_BBOX_XMAX >= xmin) & (_BBOX_YMIN <= ymax) & (_BBOX_YMAX >= ymin)
+    return (_BBOX_XMIN < xmax) & (_BBOX_XMAX > xmin) & (_BBOX_YMIN < ymax) & (_BBOX_YMAX > ymin)
+
+def _s3_key_path(uri: str) -> str:
+    """Bucket/key path of an S3 URI, as S3FileSystem expects it."""
+    # strip the scheme only at the start, so keys that contain "s3://" are left alone
+    return uri.removeprefix("s3://")
+
+@lru_cache(maxsize=256)
+def _dataset_path(main_path: str, release: str, prefix: str) -> str:
+    """Dataset URI for a release and theme prefix, formatted once per combination."""
+    return main_path.format(release=release) + prefix
+
+@lru_cache(maxsize=8)
+def _s3_filesystem(region: str) -> S3FileSystem:
+    """Anonymous S3 filesystem for the region, shared across reads."""
+    return S3FileSystem(anonymous=True, region=region,
+                        connect_timeout=S3_CONNECT_TIMEOUT, request_timeout=S3_REQUEST_TIMEOUT)
+
+@lru_cache(maxsize=64)
+def _open_dataset(clean_path: str, region: str) -> Dataset:
+    """Open a PyArrow dataset once per path so file listing and footers are not re-fetched."""
+    return dataset(clean_path, filesystem=_s3_filesystem(region))
+
+@lru_cache(maxsize=64)
+def _geo_metadata(clean_path: str, region: str) -> tuple[str, Schema]:
+    """Geometry column name and geoarrow-tagged schema of a GeoParquet dataset, decoded once."""
+    schema = _open_dataset(clean_path, region).schema
+    # only the geo key is needed, and json.loads takes the raw bytes
+    geo_dict = loads(schema.metadata[b"geo"])
+    geo_column = geo_dict["primary_column"]
+    
+    # convert geometry column to correct type in schema
+    geometry_field_index = schema.get_field_index(geo_column)
+    geometry_field = schema.field(geometry_field_index)
+    geoarrow_geometry_field = geometry_field.with_metadata(
+        {b"ARROW:extension:name": b"geoarrow.wkb"}
+    )
+    return geo_column, schema.set(geometry_field_index, geoarrow_geometry_field)
+
+def _prune_row_groups(ds: Dataset, filter_expr: Expression) -> Dataset:
+    """Narrow a dataset down to the row groups whose Parquet statistics can satisfy the filter."""
+    fragments = list(ds.get_fragments(filter=filter_expr))
+    
+    # footers are fetched while splitting, so split the files concurrently
+    with ThreadPoolExecutor(max_workers=io_thread_count()) as executor:
+        split_fragments = executor.map(
+            lambda fragment: fragment.split_by_row_group(filter_expr, schema=ds.schema), fragments
+        )
+        row_groups = [row_group for split in split_fragments for row_group in split]
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        total = sum(fragment.num_row_groups for fragment in fragments)
+        logger.debug("Scanning %d of %d row groups in %d files after statistics pruning",
+                    len(row_groups), total, len(fragments))
+    return FileSystemDataset(row_groups, ds.schema, ds.format, ds.filesystem)
+
+def _filter_table(table: Table, filters: FilterStructure, keep_columns: list[str] | None = None) -> Table:
+    """Apply a filter structure to each non-empty batch of a table, copying only keep_columns (or all)."""
+    mask = compile_filter_structure(filters, table.schema)
+    if keep_columns is None:
+        batches = [b.filter(mask(b)) for b in table.to_batches() if b.num_rows > 0]
+        return Table.from_batches(batches, schema=table.schema)
+    # columns only needed by the filter are dropped before the surviving rows are copied
+    batches = [b.select(keep_columns).filter(mask(b)) for b in table.to_batches() if b.num_rows > 0]
+    return Table.from_batches(batches, schema=table.select(keep_columns).schema)
+
+def _scan_columns(columns: list[str] | None, residual_filters: FilterStructure | None,
+                  required: tuple[str, ...] = ()) -> list[str] | None:
+    """Columns to read from Parquet: the requested ones plus any needed after the scan, or None for all."""
+    if not columns:
+        return None
+    extra = filter_structure_columns(residual_filters) if residual_filters else []
+    return list(dict.fromkeys([*columns, *required, *extra]))
+
 def schema_from_dataset(s3_path,region):
     """
     Get schema from PyArrow dataset.
@@ -29,24 +153,14 @@ def schema_from_dataset(s3_path,region):
     Schema
         PyArrow schema from given dataset.
     """
-    ds = dataset(
-            s3_path, filesystem=S3FileSystem(anonymous=True, region=region)
-        )
+    ds = _open_dataset(_s3_key_path(s3_path), region)
     return ds.schema
 
-def _decode_bytes(obj):
-    if isinstance(obj, dict):
-        return {_decode_bytes(k): _decode_bytes(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [_decode_bytes(i) for i in obj]
-    elif isinstance(obj, bytes):
-        return obj.decode("utf-8")
-    else:
-        return obj
-
 def read_geoparquet_arrow(path: str, region: str, bbox: tuple[float,float,float,float], 
                         columns: list[str] | None = None, 
-                        filters: FilterStructure | None = None) -> GeoDataFrame:
+                        filters: FilterStructure | None = None,
+                        bbox_tiles: list[tuple[float,float,float,float]] | None = None,
+                        return_arrow: bool = False) -> GeoDataFrame | Table:
     """
     Read geospatial data from a parquet file on S3 with filtering by bbox.
     
@@ -62,66 +176,67 @@ def read_geoparquet_arrow(path: str, region: str, bbox: tuple[float,float,float,
         Columns to select
     filters : FilterStructure, optional
         Filter expression
+    bbox_tiles : list, optional
+        Smaller boxes inside bbox that together cover the area of interest, rows must
+        intersect at least one of them
+    return_arrow : bool, default False
+        Whether to return the PyArrow table, with the geometry column tagged as
+        geoarrow.wkb, instead of converting it to a GeoDataFrame
         
     Returns:
     --------
-    GeoDataFrame
+    GeoDataFrame or Table
         Filtered geodataframe
     """
     # get pyarrow dataset
-    clean_path = path.replace("s3://", "")
+    clean_path = _s3_key_path(path)
     try:
-        ds = dataset(
-            clean_path, filesystem=S3FileSystem(anonymous=True, region=region)
-        )
+        ds = _open_dataset(clean_path, region)
     except Exception as e:
         raise S3ReadError(f"Read from bucket {clean_path} could not be complete.") from e
     
-    xmin, ymin, xmax, ymax = bbox
-    
-    geo_filter_expr = (
-        (field("bbox", "xmin") < xmax)
-        & (field("bbox", "xmax") > xmin)
-        & (field("bbox", "ymin") < ymax)
-        & (field("bbox", "ymax") > ymin)
-    )
-    
+    geo_filter_expr = _bbox_filter(tuple(bbox))
     
-    # filter with bounding box
-    try:
-        batches = ds.to_batches(filter=geo_filter_expr)
-    except Exception as e:
-        exc_info = sys.exc_info()[0]
-        catch_column_filter_error(exc_info,e)
-        
-    non_empty_batches = (b for b in batches if b.num_rows > 0)
+    # tighten to the tiles, inclusively so rows on a shared tile edge are kept
+    if bbox_tiles:
+        tiles_expr = reduce(or_, (_bbox_filter(tuple(tile), inclusive=True) for tile in bbox_tiles))
+        geo_filter_expr = geo_filter_expr & tiles_expr
     
     
+    geo_column, geoarrow_schema = _geo_metadata(clean_path, region)
     
-    def filter_batches(batches):
-        for b in batches:
-            yield evaluate_filter_structure(b,filters)
+    # filter with bounding box and every filter Arrow can express, skipping row groups that cannot match
+    with column_filter_errors():
+        filter_expr, residual_filters = split_filter_structure(filters, ds.schema) if filters else (None, None)
+        scan_columns = _scan_columns(columns, residual_filters, required=(geo_column,))
+        scan_filter_expr = geo_filter_expr if filter_expr is None else geo_filter_expr & filter_expr
+        ds = _prune_row_groups(ds, scan_filter_expr)
+        scanner = ds.scanner(
+            columns=scan_columns,
+            filter=scan_filter_expr,
+            fragment_scan_options=PARQUET_SCAN_OPTIONS,
+            batch_readahead=BATCH_READAHEAD,
+            fragment_readahead=MAX_CONCURRENT_ROW_GROUPS,
+            use_threads=True
+        )
+        
+        # collect batches on Arrow's threads instead of pulling them one at a time through Python
+        table = scanner.to_table()
+        
+        # apply the filters that could not be pushed down to the scanner (if needed)
+        if residual_filters:
+            keep_columns = list(dict.fromkeys([*columns, geo_column])) if columns else None
+            table = _filter_table(table, residual_filters, keep_columns)
     
-    # generate results from complex filters(if needed)
-    if filters:
-        filtered_batches = filter_batches(non_empty_batches)
-    else:
-        filtered_batches = non_empty_batches
-    # convert geometry column to correct type in schema
-    schema = ds.schema
-    metadata_str = _decode_bytes(schema.metadata) 
-    geo_dict = loads(metadata_str["geo"])
-    geo_column = geo_dict["primary_column"]
+    # retag the geometry column as geoarrow.wkb without copying the buffers
+    read_schema = schema([geoarrow_schema.field(name) for name in table.column_names],
+                        metadata=geoarrow_schema.metadata)
+    table = Table.from_arrays(table.columns, schema=read_schema)
+    if return_arrow:
+        return table.select(columns) if columns else table
     
-    geometry_field_index = schema.get_field_index(geo_column)
-    geometry_field = schema.field(geometry_field_index)
-    geoarrow_geometry_field = geometry_field.with_metadata(
-        {b"ARROW:extension:name": b"geoarrow.wkb"}
-    )
-
-    geoarrow_schema = schema.set(geometry_field_index, geoarrow_geometry_field)
-    reader = RecordBatchReader.from_batches(geoarrow_schema, filtered_batches)
-    gdf = GeoDataFrame.from_arrow(reader)
+    # geopandas decodes the geoarrow.wkb column with shapely's vectorized from_wkb, no object-dtype detour
+    gdf = GeoDataFrame.from_arrow(table, geometry=geo_column)
     gdf.set_crs("EPSG:4326",inplace=True)
     
     try:
@@ -134,7 +249,8 @@ def read_geoparquet_arrow(path: str, region: str, bbox: tuple[float,float,float,
 
 def read_parquet_arrow(path: str, region: str, 
                     columns: list[str] | None = None, 
-                    filters: FilterStructure | None = None) -> GeoDataFrame:
+                    filters: FilterStructure | None = None,
+                    return_arrow: bool = False) -> GeoDataFrame | Table:
     """
     Read tabular data from a parquet file on S3.
     
@@ -148,56 +264,49 @@ def read_parquet_arrow(path: str, region: str,
         Columns to select
     filters : FilterStructure, optional
         Filter expression
+    return_arrow : bool, default False
+        Whether to return the PyArrow table instead of converting it to a DataFrame
         
     Returns:
     --------
-    GeoDataFrame
+    DataFrame or Table
         Filtered dataframe
     """
     
     # get pyarrow dataset
-    clean_path = path.replace("s3://", "")
+    clean_path = _s3_key_path(path)
     try:
-        ds = dataset(
-            clean_path, filesystem=S3FileSystem(anonymous=True, region=region)
-        )
+        ds = _open_dataset(clean_path, region)
     except Exception as e:
         raise S3ReadError(f"Read from bucket {clean_path} could not be complete.") from e
     
-    try:
-        batches = ds.to_batches()
-    except Exception as e:
-        exc_info = sys.exc_info()[0]
-        catch_column_filter_error(exc_info,e)
+    with column_filter_errors():
+        filter_expr, residual_filters = split_filter_structure(filters, ds.schema) if filters else (None, None)
+        scanner = ds.scanner(
+            columns=_scan_columns(columns, residual_filters),
+            filter=filter_expr,
+            fragment_scan_options=PARQUET_SCAN_OPTIONS,
+            batch_readahead=BATCH_READAHEAD,
+            fragment_readahead=FRAGMENT_READAHEAD,
+            use_threads=True
+        )
+        table = scanner.to_table()
         
-    non_empty_batches = (b for b in batches if b.num_rows > 0)
-    
-    def filter_batches(batches):
-        for b in batches:
-            yield evaluate_filter_structure(b,filters)
+        # apply the filters that could not be pushed down to the scanner (if needed)
+        if residual_filters:
+            table = _filter_table(table, residual_filters, columns or None)
     
-    # generate results from complex filters(if needed)
-    if filters:
-        filtered_batches = filter_batches(non_empty_batches)
-    else:
-        filtered_batches = non_empty_batches
+    if return_arrow:
+        return table.select(columns) if columns else table
     
-    schema = ds.schema
-    reader = RecordBatchReader.from_batches(schema, filtered_batches)
-    df = reader.read_pandas()
+    df = table.to_pandas()
     if columns:
         df = df[columns]
     return df
 
-def _get_gdf_from_bbox(release:str, bbox:tuple[float,float,float,float], columns:list[str], filters: FilterStructure, prefix: str, path: str, region: str):
-    """Helper function to get a geodataframe from a bounding box."""
-    main_path = path.format(release=release) + prefix
-    gdf = read_geoparquet_arrow(main_path, region, bbox, columns=columns, filters=filters)
-    return gdf
-
 def from_address(address: str | tuple[float,float], prefix: str, main_path: str, region: str,
             release: str, columns: list[str]| None = None, filters: FilterStructure| None = None,
-            distance: float = 500, unit: str = "m") -> GeoDataFrame:
+            distance: float = 500, unit: str = "m", return_arrow: bool = False) -> GeoDataFrame | Table:
     """
     Wrapper to geocode an address and fetch the geoparquet data within the address's area.
     
@@ -221,18 +330,22 @@ def from_address(address: str | tuple[float,float], prefix: str, main_path: str,
         Buffer distance
     unit : str, default 'm'
         Unit of distance
+    return_arrow : bool, default False
+        Whether to return a PyArrow table instead of a GeoDataFrame
         
     Returns:
     --------
-    GeoDataFrame
+    GeoDataFrame or Table
         Filtered geodataframe
     """
     bbox = geocode_point_to_bbox(address, distance, unit)
-    gdf = from_bbox(bbox,prefix,main_path,region,release,columns,filters)
+    data_path = _dataset_path(main_path, release, prefix)
+    gdf = read_geoparquet_arrow(data_path, region, bbox, columns=columns, filters=filters, return_arrow=return_arrow)
     return gdf
     
 def from_place(address: str, prefix: str, main_path: str, region: str, release: str,
-            columns: list[str]| None=None, filters: FilterStructure| None=None) -> GeoDataFrame:
+            columns: list[str]| None=None, filters: FilterStructure| None=None,
+            return_arrow: bool = False) -> GeoDataFrame | Table:
     """
     Wrapper to geocode a place and fetch the geoparquet data within the place.
     
@@ -252,19 +365,43 @@ def from_place(address: str, prefix: str, main_path: str, region: str, release:
         Columns to select
     filters : FilterStructure, optional
         Filter expression
+    return_arrow : bool, default False
+        Whether to return a PyArrow table instead of a GeoDataFrame
         
     Returns:
     --------
-    GeoDataFrame
+    GeoDataFrame or Table
         Filtered geodataframe
     """
     geometry, bbox = geocode_place_to_bbox(address)
-    gdf = from_bbox(bbox,prefix,main_path,region,release,columns,filters)
-    filtered_gdf = gdf[gdf.within(geometry)]
-    return filtered_gdf
+    data_path = _dataset_path(main_path, release, prefix)
+    clean_path = _s3_key_path(data_path)
+    try:
+        geo_column, _ = _geo_metadata(clean_path, region)
+    except Exception as e:
+        raise S3ReadError(f"Read from bucket {clean_path} could not be complete.") from e
+    
+    # the geometry is needed for the place test even when the requested columns leave it out
+    read_columns = list(dict.fromkeys([*columns, geo_column])) if columns else None
+    
+    # scan only the grid tiles the place covers rather than its whole bounding box
+    gdf = read_geoparquet_arrow(data_path, region, bbox, columns=read_columns, filters=filters,
+                                bbox_tiles=geometry_tiles(geometry), return_arrow=return_arrow)
+    if return_arrow:
+        # decode only the geometry column to test it against the place
+        geometries = from_wkb(gdf.column(geo_column).to_numpy(zero_copy_only=False))
+        within_idx = STRtree(geometries).query(geometry, predicate="contains")
+        filtered_table = gdf.take(np.sort(within_idx))
+        return filtered_table.select(columns) if columns else filtered_table
+    
+    # the R-tree query runs the exact predicate only on candidates whose envelopes intersect the place
+    within_idx = gdf.sindex.query(geometry, predicate="contains")
+    filtered_gdf = gdf.iloc[np.sort(within_idx)]
+    return filtered_gdf[columns] if columns else filtered_gdf
 
 def from_bbox(bbox: tuple[float,float,float,float], prefix: str, main_path: str, region: str, 
-            release: str, columns: list[str]| None=None, filters: FilterStructure| None=None) -> GeoDataFrame:
+            release: str, columns: list[str]| None=None, filters: FilterStructure| None=None,
+            return_arrow: bool = False) -> GeoDataFrame | Table:
     """
     Wrapper to fetch the geoparquet data within the bounding box.
     
@@ -284,11 +421,68 @@ def from_bbox(bbox: tuple[float,float,float,float], prefix: str, main_path: str,
         Columns to select
     filters : FilterStructure, optional
         Filter expression
+    return_arrow : bool, default False
+        Whether to return a PyArrow table instead of a GeoDataFrame
         
     Returns:
     --------
-    GeoDataFrame
+    GeoDataFrame or Table
         Filtered geodataframe
     """
-    gdf = _get_gdf_from_bbox(release, bbox, columns, filters, prefix, main_path, region)
-    return gdf
\ No newline at end of file
+    data_path = _dataset_path(main_path, release, prefix)
+    gdf = read_geoparquet_arrow(data_path, region, bbox, columns=columns, filters=filters, return_arrow=return_arrow)
+    return gdf
+
+def from_bboxes(bboxes: list[tuple[float,float,float,float]], prefix: str, main_path: str, region: str, 
+            release: str, columns: list[str]| None=None, filters: FilterStructure| None=None,
+            return_arrow: bool = False, max_workers: int = 8) -> GeoDataFrame | Table:
+    """
+    Wrapper to fetch the geoparquet data within several bounding boxes concurrently.
+    
+    Parameters:
+    -----------
+    bboxes : list
+        Bounding boxes as (minx, miny, maxx, maxy)
+    prefix : str
+        Path prefix for the data
+    main_path : str
+        Base path template with {release} placeholder
+    region : str
+        AWS region
+    release : str
+        Release version
+    columns : list, optional
+        Columns to select
+    filters : FilterStructure, optional
+        Filter expression
+    return_arrow : bool, default False
+        Whether to return a PyArrow table instead of a GeoDataFrame
+    max_workers : int, default 8
+        Maximum number of bounding boxes read at the same time
+        
+    Returns:
+    --------
+    GeoDataFrame or Table
+        Results of every bounding box, in the order of bboxes. Rows intersecting
+        several boxes appear once per box.
+    
+    Raises:
+    -------
+    ValueError
+        If no bounding boxes are given
+    """
+    if not bboxes:
+        raise ValueError("At least one bounding box is required")
+    data_path = _dataset_path(main_path, release, prefix)
+    
+    def read_bbox(bbox):
+        return read_geoparquet_arrow(data_path, region, bbox, columns=columns, filters=filters,
+                                    return_arrow=return_arrow)
+    
+    # reads are I/O-bound and Arrow releases the GIL while scanning, so threads overlap them
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(read_bbox, bboxes))
+    
+    if return_arrow:
+        return concat_tables(results)
+    return concat(results, ignore_index=True)
@@ -3,30 +3,44 @@
 from __future__ import annotations
 
 import sys
+import contextlib
 import functools
 import inspect
+import operator
 import re
-from typing import Union, List, Tuple, Any, Literal
+from typing import Callable, Iterable, Iterator, Union, List, Tuple, Any, Literal
 from typing_extensions import TypeAlias
 
-from pyarrow.compute import equal,not_equal,greater,less,greater_equal,less_equal,and_,or_
-from pyarrow.types import is_struct
-from pyarrow import array, scalar, RecordBatch
+from pyarrow.compute import (
+    equal,not_equal,greater,less,greater_equal,less_equal,is_in,field,match_substring,Expression,
+    and_kleene,or_kleene,fill_null,list_flatten,list_parent_indices,SetLookupOptions,starts_with,ends_with
+)
+from pyarrow.types import is_struct, is_string, is_large_string, is_list, is_large_list, is_nested
+import numpy as np
+from pyarrow import array, scalar, bool_, Array, DataType, RecordBatch, Schema
+from pyarrow.lib import ArrowInvalid, ArrowNotImplementedError, ArrowTypeError
 
 from ._errors import UnsupportedOperatorError
 
 def _run_before_decorator(before_func):
     """Returns a decorator that runs the specified `before_func` before the wrapped function."""
     def decorator(func):
+        # The signature never changes, so locate 'release' once instead of binding on every call
+        sig = inspect.signature(func)
+        if "release" not in sig.parameters:
+            return func
+        release_param = sig.parameters["release"]
+        release_index = list(sig.parameters).index("release")
+        positional = release_param.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             # Extract 'release' argument
-            sig = inspect.signature(func)
-            bound_args = sig.bind(*args, **kwargs)
-            bound_args.apply_defaults()
-
-            if "release" in bound_args.arguments:
-                release_value = bound_args.arguments["release"]
+            if positional and len(args) > release_index:
+                release_value = args[release_index]
+            else:
+                release_value = kwargs.get("release", release_param.default)
+            if release_value is not inspect.Parameter.empty:
                 before_func(release_value)
 
             return func(*args, **kwargs)
@@ -38,15 +52,16 @@ def wrap_functions_with_release(module_name, before_func,func_list):
     """Dynamically wraps all functions with 'release' parameter in the given module."""
     module = sys.modules[module_name]
     
-    for name in dir(module):
+    # Only the listed user-facing functions are candidates, so skip scanning the whole module
+    # The decorator returns functions without a 'release' parameter unchanged, so each signature is inspected once
+    decorator = _run_before_decorator(before_func)
+    for name in func_list:
         attr = getattr(module, name)
-        if callable(attr) and name != before_func.__name__ and name in func_list: # Wrap only user-facing functions with "release"
-            sig = inspect.signature(attr)
-            if "release" in sig.parameters:  
-                setattr(module, name, _run_before_decorator(before_func)(attr))
+        if callable(attr) and name != before_func.__name__:
+            setattr(module, name, decorator(attr))
 
 FieldName: TypeAlias = str
-OperatorStr: TypeAlias = Literal["==", "!=", "<", "<=", ">", ">=","contains", "isin"]
+OperatorStr: TypeAlias = Literal["==", "!=", "<", "<=", ">", ">=","contains", "isin", "starts_with", "ends_with"]
 FilterValue: TypeAlias = Union[str, int, float, List[Any], Tuple[Any, ...], None]
 FilterTuple: TypeAlias = Tuple[FieldName, OperatorStr, FilterValue]
 FilterGroup: TypeAlias = List[FilterTuple]
@@ -54,8 +69,10 @@ FilterGroup: TypeAlias = List[FilterTuple]
 FilterStructure: TypeAlias = List[Union[FilterTuple, FilterGroup]] | FilterTuple
 """FilterStructure represents a list of filtering rules for a DataFrame-like object."""
 
+MaskFunction: TypeAlias = Callable[[RecordBatch], Array]
+
     
-def _parse_field_path(field_spec):
+def _parse_field_path(field_spec: str) -> tuple[str, list[str]]:
     """Parse a field specification that contains nested dictionary access."""
     path_parts = field_spec.split('.')
     base_column = path_parts[0]
@@ -63,7 +80,7 @@ def _parse_field_path(field_spec):
     
     return base_column, keys
 
-def _extract_nested_value(array_column, keys):
+def _extract_nested_value(array_column: Array, keys: list[str]) -> Array:
     """Extract nested values from a dictionary/struct column."""
     current = array_column
     
@@ -75,50 +92,267 @@ def _extract_nested_value(array_column, keys):
     
     return current
 
-def _evaluate_condition(batch: RecordBatch, col: str, op:str, val:Any):
-    """Return mask for batch based on filter."""
-    if '.' in col:
-        base_column, keys = _parse_field_path(col)
-        # Extract the field value using the path
-        if base_column in batch.column_names:
-            col_values = _extract_nested_value(batch[base_column], keys)
-        else:
-            raise ValueError(f"Column '{base_column}' not found in dataset")
+@functools.lru_cache(maxsize=1024)
+def _value_set_options(values: tuple, value_type: DataType) -> SetLookupOptions:
+    """is_in options for filter values, built once per values and element type rather than per batch."""
+    return SetLookupOptions(value_set=array(list(values), type=value_type))
+
+def _list_value_set(values: list, value_type: DataType) -> SetLookupOptions:
+    """is_in options for list-element values, cached unless the values cannot key the cache."""
+    try:
+        return _value_set_options(tuple(values), value_type)
+    except (ArrowTypeError, ArrowInvalid):
+        raise
+    except TypeError:
+        # unhashable values (e.g. nested lists) are built for this condition only
+        return SetLookupOptions(value_set=array(values, type=value_type))
+
+def _isin_values(val: Any) -> list:
+    """Values of an isin filter as a list; any non-string iterable (list, set, array...) is a collection of values."""
+    if isinstance(val, (str, bytes)) or not isinstance(val, Iterable):
+        return [val]
+    return list(val)
+
+def _contains_mask(col_values: Array, val: Any) -> Array:
+    """Mask of rows whose string contains, or whose list holds, the value (or any of a list of values)."""
+    values = val if isinstance(val, list) else [val]
+    col_type = col_values.type
+    if is_string(col_type) or is_large_string(col_type):
+        if not values:
+            return array(np.zeros(len(col_values), dtype=bool))
+        mask = functools.reduce(or_kleene, (match_substring(col_values, v) for v in values))
+        return fill_null(mask, False)
+    if (is_list(col_type) or is_large_list(col_type)) and not is_nested(col_type.value_type):
+        # test every list element at once, then mark the rows owning a hit
+        try:
+            options = _list_value_set(values, col_type.value_type)
+        except (ArrowTypeError, ArrowInvalid):
+            # a value of another type than the list elements can never be held by a list
+            return array(np.zeros(len(col_values), dtype=bool))
+        hits = is_in(list_flatten(col_values), options=options).to_numpy(zero_copy_only=False)
+        parents = list_parent_indices(col_values).to_numpy()
+        mask = np.zeros(len(col_values), dtype=bool)
+        mask[parents[hits]] = True
+        return array(mask)
+    # no kernel for other types, so test in Python but write straight into a preallocated bool buffer
+    mask = np.fromiter(
+        (value is not None and any(v in value for v in values) for value in col_values.to_pylist()),
+        dtype=bool, count=len(col_values)
+    )
+    return array(mask)
+
+# Comparison operators map straight onto compute kernels, which accept arrays and expressions alike
+_COMPARISON_KERNELS = {
+    "==": equal,
+    "!=": not_equal,
+    ">": greater,
+    "<": less,
+    ">=": greater_equal,
+    "<=": less_equal,
+}
+
+# String affix operators, with the pattern passed as a kernel option
+_AFFIX_KERNELS = {
+    "starts_with": starts_with,
+    "ends_with": ends_with,
+}
+
+def _prefix_upper_bound(prefix: str) -> str | None:
+    """Smallest string greater than every string starting with prefix, or None if there is none."""
+    while prefix:
+        last = ord(prefix[-1])
+        if last < sys.maxunicode:
+            return prefix[:-1] + chr(last + 1)
+        prefix = prefix[:-1]
+    return None
+
+def _compile_condition(col: str, op: str, val: Any, schema: Schema | None = None) -> MaskFunction:
+    """Resolve a filter triplet once into a function returning its mask for a batch."""
+    base_column, keys = _parse_field_path(col)
+    base_index = schema.get_field_index(base_column) if schema is not None else -1
+    
+    if base_index >= 0:
+        # positional access, since every batch shares the schema the filter was compiled against
+        def column_values(batch: RecordBatch):
+            return _extract_nested_value(batch.column(base_index), keys)
     else:
-        col_values = batch[col]
-    if op == "==":
-        return equal(col_values, scalar(val))
-    elif op == "!=":
-        return not_equal(col_values, scalar(val))
-    elif op == ">":
-        return greater(col_values, scalar(val))
-    elif op == "<":
-        return less(col_values, scalar(val))
-    elif op == ">=":
-        return greater_equal(col_values, scalar(val))
-    elif op == "<=":
-        return less_equal(col_values, scalar(val))
+        def column_values(batch: RecordBatch):
+            if keys:
+                # Extract the field value using the path
+                if base_column not in batch.column_names:
+                    raise ValueError(f"Column '{base_column}' not found in dataset")
+                return _extract_nested_value(batch[base_column], keys)
+            return batch[col]
+    
+    if op in _COMPARISON_KERNELS:
+        kernel = _COMPARISON_KERNELS[op]
     elif op == "contains":
-        mask = [any(v in value for v in val) if value is not None and isinstance(val, list) else (val in value if value is not None else False) for value in col_values.to_pylist()]
-        return array(mask)
+        return lambda batch: _contains_mask(column_values(batch), val)
+    elif op == "isin":
+        options = SetLookupOptions(value_set=array(_isin_values(val)))
+        return lambda batch: is_in(column_values(batch), options=options)
+    elif op in _AFFIX_KERNELS:
+        affix_kernel = _AFFIX_KERNELS[op]
+        return lambda batch: affix_kernel(column_values(batch), pattern=val)
     else:
         raise UnsupportedOperatorError(f"Unsupported operator: {op}")
     
-def evaluate_filter_structure(batch: RecordBatch, structure):
-    """
-    Evaluate a recursive filter structure into a PyArrow boolean array.
+    # box the comparison value once rather than per batch
+    value = scalar(val)
+    return lambda batch: kernel(column_values(batch), value)
+    
+def _is_filter_triplet(item: Any) -> bool:
+    return (isinstance(item, tuple) and len(item) == 3 and 
+            isinstance(item[0], str) and isinstance(item[1], str))
 
-    See docstring above for rules.
+def _merge_equalities(triplets: list[FilterTuple]) -> list[FilterTuple]:
+    """Rewrite OR'ed equalities on the same column into a single isin, so the column is scanned once."""
+    values_by_column = {}
+    for col, op, val in triplets:
+        if op == "==" and val is not None and not isinstance(val, (list, tuple)):
+            values_by_column.setdefault(col, []).append(val)
+    
+    merged = []
+    done = set()
+    for col, op, val in triplets:
+        values = values_by_column.get(col, [])
+        # mixed value types cannot share one value set
+        if op != "==" or len(values) < 2 or len({type(v) for v in values}) > 1 or val not in values:
+            merged.append((col, op, val))
+        elif col not in done:
+            merged.append((col, "isin", list(dict.fromkeys(values))))
+            done.add(col)
+    return merged
+
+def _schema_field_type(schema: Schema, col: str) -> DataType | None:
+    """Type of a (possibly dotted, nested) column in the schema, or None if it does not exist."""
+    base_column, keys = _parse_field_path(col)
+    index = schema.get_field_index(base_column)
+    if index < 0:
+        return None
+    current = schema.field(index).type
+    for key in keys:
+        if not is_struct(current) or current.get_field_index(key) < 0:
+            return None
+        current = current.field(key).type
+    return current
+
+def _condition_to_expression(schema: Schema, col: str, op: str, val: Any) -> Expression | None:
+    """Translate one filter triplet to a PyArrow expression, or None if Arrow cannot express it."""
+    if op not in _COMPARISON_KERNELS and op not in _AFFIX_KERNELS and op not in ("contains", "isin"):
+        raise UnsupportedOperatorError(f"Unsupported operator: {op}")
+    
+    # resolve the full dotted path, so a bad nested key is reported rather than its (existing) parent column
+    col_type = _schema_field_type(schema, col)
+    if col_type is None:
+        raise KeyError(f"Invalid column name:\"{col}\"")
+    
+    col_field = field(*col.split('.'))
+    if op in _COMPARISON_KERNELS:
+        return _COMPARISON_KERNELS[op](col_field, scalar(val))
+    elif op == "contains":
+        # substring matching on string columns only, list membership stays in Python
+        if not (is_string(col_type) or is_large_string(col_type)):
+            return None
+        patterns = val if isinstance(val, list) else [val]
+        if not patterns:
+            return None
+        return functools.reduce(operator.or_, (match_substring(col_field, pattern) for pattern in patterns))
+    elif op == "isin":
+        return col_field.isin(_isin_values(val))
+    else:
+        if not (is_string(col_type) or is_large_string(col_type)):
+            return None
+        expr = _AFFIX_KERNELS[op](col_field, pattern=val)
+        if op == "starts_with" and val:
+            # the equivalent range lets the reader skip row groups by their min/max statistics
+            expr = (col_field >= val) & expr
+            upper = _prefix_upper_bound(val)
+            if upper is not None:
+                expr = (col_field < upper) & expr
+        return expr
+
+def _filter_conjuncts(structure: FilterStructure) -> list[list[FilterTuple]]:
+    """Flatten a filter structure into the groups of triplets that are AND'ed together."""
+    if _is_filter_triplet(structure):
+        return [[structure]]
+    if not isinstance(structure, list):
+        raise ValueError(f"Invalid filter structure: {structure}")
+    
+    raw_triplets = []
+    conjuncts = []
+    for item in structure:
+        if _is_filter_triplet(item):
+            raw_triplets.append(item)
+        elif isinstance(item, list):
+            conjuncts.extend(_filter_conjuncts(item))
+        else:
+            raise ValueError(f"Invalid filter element: {item}")
+    if raw_triplets:
+        conjuncts.insert(0, _merge_equalities(raw_triplets))
+    return conjuncts
+
+def split_filter_structure(structure: FilterStructure, schema: Schema) -> tuple[Expression | None, FilterStructure | None]:
     """
+    Split a filter structure into a PyArrow expression for the scanner and a residual structure.
+    
+    The expression is pushed down so Parquet statistics can skip row groups, and the residual
+    holds the conditions Arrow cannot express (e.g. contains on list columns), which are
+    evaluated per batch with compile_filter_structure.
+    
+    Parameters:
+    -----------
+    structure : FilterStructure
+        Filter structure given by the user
+    schema : Schema
+        Schema of the dataset being filtered
+    
+    Returns:
+    --------
+    tuple
+        (expression or None, residual structure or None)
+    """
+    pushdown_groups = []
+    residual = []
+    for group in _filter_conjuncts(structure):
+        expressions = [_condition_to_expression(schema, *triplet) for triplet in group]
+        if any(expr is None for expr in expressions):
+            residual.append(group)
+            continue
+        pushdown_groups.append(functools.reduce(operator.or_, expressions))
+    pushdown = functools.reduce(operator.and_, pushdown_groups) if pushdown_groups else None
+    return pushdown, (residual or None)
+
+def filter_structure_columns(structure: FilterStructure) -> list[str]:
+    """Top-level column names referenced by a filter structure, in order of first use."""
+    columns = [_parse_field_path(col)[0] for group in _filter_conjuncts(structure) for col, _, _ in group]
+    return list(dict.fromkeys(columns))
 
-    def is_filter_triplet(item):
-        return (isinstance(item, tuple) and len(item) == 3 and 
-                isinstance(item[0], str) and isinstance(item[1], str))
+def _or_masks(mask_functions: list[MaskFunction], batch: RecordBatch) -> Array:
+    """OR full-length masks on their bitmaps, leaving nulls for the final fill."""
+    return functools.reduce(or_kleene, (mask_function(batch) for mask_function in mask_functions))
 
-    def _eval_recursive(structure):
-        if is_filter_triplet(structure):
-            col, op, val = structure
-            return _evaluate_condition(batch, col, op, val)
+def _and_masks(mask_functions: list[MaskFunction], batch: RecordBatch) -> Array:
+    """AND full-length masks on their bitmaps, skipping the remaining conditions once no row can pass."""
+    result = mask_functions[0](batch)
+    for mask_function in mask_functions[1:]:
+        # rows that are null or False here can no longer become True under Kleene logic
+        if result.true_count == 0:
+            break
+        result = and_kleene(result, mask_function(batch))
+    return result
+
+def compile_filter_structure(structure: FilterStructure, schema: Schema | None = None) -> MaskFunction:
+    """
+    Compile a recursive filter structure into a function returning a PyArrow boolean mask for a batch.
+    
+    Field paths, operators and values are resolved once, so scans over many batches only run
+    the compute kernels. When the schema of the batches is given, columns are looked up by index.
+    """
+
+    def _compile_recursive(structure: FilterStructure) -> MaskFunction:
+        if _is_filter_triplet(structure):
+            return _compile_condition(*structure, schema=schema)
 
         if not isinstance(structure, list):
             raise ValueError(f"Invalid filter structure: {structure}")
@@ -127,58 +361,91 @@ def evaluate_filter_structure(batch: RecordBatch, structure):
         raw_triplets = []
 
         for item in structure:
-            if is_filter_triplet(item):
+            if _is_filter_triplet(item):
                 raw_triplets.append(item)
             elif isinstance(item, list):
-                # Recursively evaluate nested structure
-                processed_masks.append(_eval_recursive(item))
+                # Recursively compile nested structure
+                processed_masks.append(_compile_recursive(item))
             else:
                 raise ValueError(f"Invalid filter element: {item}")
 
         # If raw triplets exist at this level, OR them together
-        if raw_triplets:
-            raw_masks = [_evaluate_condition(batch, *triplet) for triplet in raw_triplets]
-            combined_raw = raw_masks[0]
-            for mask in raw_masks[1:]:
-                combined_raw = or_(combined_raw, mask)
-            processed_masks.insert(0, combined_raw)
+        raw_triplets = _merge_equalities(raw_triplets)
+        if len(raw_triplets) == 1:
+            processed_masks.insert(0, _compile_condition(*raw_triplets[0], schema=schema))
+        elif raw_triplets:
+            raw_masks = [_compile_condition(*triplet, schema=schema) for triplet in raw_triplets]
+            processed_masks.insert(0, lambda batch: _or_masks(raw_masks, batch))
+
+        # Single-element groups need no combining, so the compiled tree is only as deep as the real nesting
+        if len(processed_masks) == 1:
+            return processed_masks[0]
+        if not processed_masks:
+            raise ValueError(f"Invalid filter structure: {structure}")
 
         # Now, apply AND to all collected processed masks (from this and sub-levels)
-        result = processed_masks[0]
-        for mask in processed_masks[1:]:
-            result = and_(result, mask)
+        return lambda batch: _and_masks(processed_masks, batch)
 
-        return result
+    compiled = _compile_recursive(structure)
 
-    final_mask = _eval_recursive(structure)
-    return batch.filter(final_mask)
+    def _evaluate(batch: RecordBatch) -> Array:
+        # an empty batch needs no kernel calls at all
+        if batch.num_rows == 0:
+            return array([], type=bool_())
+        # groups combine with Kleene logic, so nulls only need resolving once at the end
+        return fill_null(compiled(batch), False)
 
+    return _evaluate
 
-def catch_column_filter_error(exc_type: BaseException,error: Exception) -> None:
+def evaluate_filter_structure_mask(batch: RecordBatch, structure: FilterStructure) -> Array:
     """
-    Throw user-friendly PyArrow errors.
-    
-    Parameters:
-    -----------
-    exc_type : BaseException
-        Exception data
-    error : Exception
-        Exception thrown
+    Evaluate a recursive filter structure into a PyArrow boolean array, without filtering the batch.
+
+    See docstring above for rules.
+    """
+    return compile_filter_structure(structure, batch.schema)(batch)
+
+def evaluate_filter_structure(batch: RecordBatch, structure: FilterStructure, columns: list[str] | None = None) -> RecordBatch:
+    """
+    Filter a batch with a recursive filter structure, keeping only the given columns (or all).
+
+    See docstring above for rules.
+    """
+    mask = evaluate_filter_structure_mask(batch, structure)
+    if columns is not None:
+        batch = batch.select(columns)
+    return batch.filter(mask)
+
+
+# Patterns pulling the column name and the mismatched types out of PyArrow error messages
+_FIELD_REF_RE = re.compile(r"FieldRef\.Name\(([^)]+)\)")
+_KERNEL_TYPES_RE = re.compile(r"\(([^)]+)\)")
+
+@contextlib.contextmanager
+def column_filter_errors() -> Iterator[None]:
+    """
+    Context manager turning PyArrow errors from bad columns or filters into user-friendly errors.
     
-    Returns:
-    --------
-    None
+    Raises:
+    -------
+    KeyError
+        If the filter or columns reference a column that does not exist
+    ValueError
+        If a filter value has the wrong type for its column
+    Exception
+        The original error, if it is not a recognized filter mistake
     """
-    # Capture the full traceback
-    error_message = str(error)
-    # print(exc_type.__name__)
-    if exc_type.__name__ == "UnsupportedOperatorError":
-        raise error
-    elif exc_type.__name__ == "ArrowInvalid":
-        match = re.search(r"FieldRef\.Name\(([^)]+)\)", error_message)
+    try:
+        yield
+    except ArrowInvalid as error:
+        match = _FIELD_REF_RE.search(str(error))
+        if match is None:
+            raise
         name = match.group(1)
         raise KeyError(f"Invalid column name:\"{name}\"") from error
-    elif exc_type.__name__ =="ArrowNotImplementedError":
-        match = re.search(r"\(([^)]+)\)", error_message)
+    except ArrowNotImplementedError as error:
+        match = _KERNEL_TYPES_RE.search(str(error))
+        if match is None or match.group(1).count(",") != 1:
+            raise
         first_value,last_value = match.group(1).split(",")
-        raise ValueError(f"Incorrect type used for value in filter: \"{last_value.strip()}\" should be \"{first_value.strip()}\"") from error
\ No newline at end of file
+        raise ValueError(f"Incorrect type used for value in filter: \"{last_value.strip()}\" should be \"{first_value.strip()}\"") from error
@@ -1,5 +1,6 @@
 """Functions to fetch geoparquet data from Foursquare Open Places on AWS"""
 from importlib import resources
+from functools import lru_cache
 from typing import Union
 from geopandas import GeoDataFrame
 from pandas import DataFrame
@@ -16,6 +17,10 @@ FSQ_PLACES_PREFIX = "places/parquet/"
 FSQ_CATEGORIES_PREFIX = "categories/parquet/"
 FSQ_LATEST_RELEASE = "2025-04-08"
 
+# Valid releases, read once at import instead of on every call
+with resources.files("pyplaces").joinpath("releases/foursquare/releases.txt").open("r", encoding="utf-8-sig") as f:
+    _VALID_RELEASES = frozenset(line.replace("dt=", "").strip(" \n/") for line in f)
+
 # FSQ_FUSED_MAIN_PATH = 's3://us-west-2.opendata.source.coop/fused/fsq-os-places/{release}/'
 # FSQ_FUSED_BUCKET = 's-west-2.opendata.source.coop'
 # FSQ_FUSED_REGION = 'us-west-2'
@@ -40,7 +45,7 @@ def foursquare_places_from_address(address: str | tuple[float,float],
     filters : FilterStructure | None, optional
         Filter criteria to apply to the results. 
         Should be a list in the format(column,operator,value)
-        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains"
+        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains","isin","starts_with","ends_with"
     distance : float, default 500
         Radius of the bounding box around the address. Defaults to 500 meters.
     unit : str, default "m"
@@ -72,7 +77,7 @@ def foursquare_places_from_place(address: str,
     filters : FilterStructure | None, optional
         Filter criteria to apply to the results.
         Should be a list in the format(column,operator,value)
-        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains"
+        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains","isin","starts_with","ends_with"
     release : str, default FSQ_LATEST_RELEASE
         Dataset release version to use. Defaults to the latest version.
         
@@ -100,7 +105,7 @@ def foursquare_places_from_bbox(bbox: tuple[float, float, float, float],
     filters : FilterStructure | None, optional
         Filter criteria to apply to the results.
         Should be a list in the format(column,operator,value)
-        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains"
+        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains","isin","starts_with","ends_with"
     release : str, default FSQ_LATEST_RELEASE
         Dataset release version to use. Defaults to the latest version.
         
@@ -125,7 +130,7 @@ def get_categories(columns: list[str] | None = None,
     filters : FilterStructure | None, optional
         Filter criteria to apply to the results.
         Should be a list in the format(column,operator,value)
-        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains"
+        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains","isin","starts_with","ends_with"
     release : str, default FSQ_LATEST_RELEASE
         Dataset release version to use. Defaults to the latest version.
         
@@ -142,6 +147,13 @@ def get_categories(columns: list[str] | None = None,
     path = FSQ_MAIN_PATH.format(release=release) + FSQ_CATEGORIES_PREFIX
     return read_parquet_arrow(path, FSQ_REGION, columns, filters)
 
+@lru_cache(maxsize=1)
+def _get_category_finder() -> CategoryFinder:
+    """Build the category finder on first use and reuse it for later searches."""
+    finder = CategoryFinder()
+    finder.load_data(get_categories())
+    return finder.process_data()
+
 def find_categories(search: str, num_results: int = 5, exact_match: bool=False,verbose: bool=False,as_df: bool= False) -> Union[list[str],DataFrame]:
     """
     Finds Foursquare Open Places categories based on a user search.
@@ -164,10 +176,7 @@ def find_categories(search: str, num_results: int = 5, exact_match: bool=False,v
     Union[list[str],Dataframe]
         Matched Foursquare Category IDs as a list of strings or DataFrame.
     """
-    finder = CategoryFinder()
-    categories = get_categories()
-    finder.load_data(categories)
-    finder.process_data()
+    finder = _get_category_finder()
     matches = finder.suggest_categories(search,num_results,exact_match,verbose,as_df,hide_ids=False,list_return="",show_name_and_id=True)
     return matches
 
@@ -185,9 +194,7 @@ def _check_release(release: str):
     ValueError
         If the specified release version does not exist in the available releases.
     """
-    with resources.files("pyplaces").joinpath("releases/foursquare/releases.txt").open("r", encoding="utf-8-sig") as f:
-        folders = [line.replace("dt=", "").strip(" \n/") for line in f]
-    if release not in folders:
+    if release not in _VALID_RELEASES:
         raise ValueError(f"Invalid release: {release}")
     
 def get_schema(categories=False,release:str=FSQ_LATEST_RELEASE) -> str:
@@ -205,7 +212,7 @@ def get_schema(categories=False,release:str=FSQ_LATEST_RELEASE) -> str:
     str
         String representation of PyArrow schema of dataset
     """
-    path = FSQ_MAIN_PATH.format(release=release).replace("s3://", "") 
+    path = FSQ_MAIN_PATH.format(release=release)
     if categories:
         path = path + FSQ_CATEGORIES_PREFIX
     else:
@@ -1,11 +1,12 @@
 """Functions to fetch  geoparquet data from Overture Maps on AWS"""
 from importlib import resources
+from functools import lru_cache
 from uuid import uuid4
 from typing import Union
 from geopandas import GeoDataFrame
 from pandas import read_csv, DataFrame
 from ._utils import FilterStructure, wrap_functions_with_release
-from ._io_utils import from_address, from_bbox, from_place, schema_from_dataset
+from ._io_utils import from_address, from_bbox, from_bboxes, from_place, schema_from_dataset
 from ._category_finder import CategoryFinder
 
 
@@ -25,6 +26,12 @@ OVERTURE_BASE_PREFIX = "theme=base/type={type}"
 
 OVERTURE_CATEGORIES_URL = "https://raw.githubusercontent.com/OvertureMaps/schema/refs/heads/main/docs/schema/concepts/by-theme/places/overture_categories.csv"
 
+# Valid releases and base types, read once at import instead of on every call
+with resources.files("pyplaces").joinpath("releases/overture/releases.txt").open("r", encoding="utf-8-sig") as f:
+    _VALID_RELEASES = frozenset(line.strip(" \n/") for line in f)
+with resources.files("pyplaces").joinpath("releases/overture/base_types.txt").open("r", encoding="utf-8-sig") as f:
+    _VALID_BASE_TYPES = frozenset(line.replace("type=", "").strip(" \n/") for line in f)
+
 def overture_places_from_address(address: str | tuple[float,float],
                                 columns: list[str]| None = None,
                                 filters: FilterStructure | None = None,
@@ -43,7 +50,7 @@ def overture_places_from_address(address: str | tuple[float,float],
     filters : FilterStructure | None, optional
         Filter criteria to apply to the results.
         Should be a list in the format(column,operator,value)
-        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains"
+        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains","isin","starts_with","ends_with"
     distance : float, optional
         Radius of the bounding box around the address. Defaults to 500 meters.
     unit : str, optional
@@ -71,7 +78,7 @@ def overture_places_from_place(address: str,columns: list[str]| None=None,filter
     filters : FilterStructure | None, optional
         Filter criteria to apply to the results.
         Should be a list in the format(column,operator,value)
-        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains"
+        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains","isin","starts_with","ends_with"
     release : str, optional
         Dataset release version to use. Defaults to the latest version.
         
@@ -95,7 +102,7 @@ def overture_places_from_bbox(bbox: tuple[float,float,float,float],columns: list
     filters : FilterStructure | None, optional
         Filter criteria to apply to the results.
         Should be a list in the format(column,operator,value)
-        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains"
+        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains","isin","starts_with","ends_with"
     release : str, optional
         Dataset release version to use. Defaults to the latest version.
         
@@ -106,6 +113,38 @@ def overture_places_from_bbox(bbox: tuple[float,float,float,float],columns: list
     """
     return from_bbox(bbox,OVERTURE_PLACES_PREFIX,OVERTURE_MAIN_PATH,OVERTURE_REGION,release,columns,filters)
 
+def overture_places_from_bboxes(bboxes: list[tuple[float,float,float,float]],columns: list[str]| None=None,filters: FilterStructure| None=None,release: str=OVERTURE_LATEST_RELEASE,max_workers: int=8)-> GeoDataFrame:
+    """
+    Retrieve places data from Overture within several bounding boxes, read concurrently.
+    
+    Parameters
+    ----------
+    bboxes : list[tuple[float, float, float, float]]
+        The bounding box coordinates (min_x, min_y, max_x, max_y) of each area
+    columns : list[str] | None, optional
+        Specific columns to include in the result.
+    filters : FilterStructure | None, optional
+        Filter criteria to apply to the results.
+        Should be a list in the format(column,operator,value)
+        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains","isin","starts_with","ends_with"
+    release : str, optional
+        Dataset release version to use. Defaults to the latest version.
+    max_workers : int, optional
+        Maximum number of bounding boxes read at the same time. Defaults to 8.
+        
+    Returns
+    -------
+    GeoDataFrame
+        A GeoDataFrame containing places data within the bounding boxes, in order.
+        Places intersecting several bounding boxes appear once per box.
+    
+    Raises
+    ------
+    ValueError
+        If bboxes is empty
+    """
+    return from_bboxes(bboxes,OVERTURE_PLACES_PREFIX,OVERTURE_MAIN_PATH,OVERTURE_REGION,release,columns,filters,max_workers=max_workers)
+
 def overture_buildings_from_address(address: str | tuple[float,float],columns: list[str]| None = None,filters: FilterStructure| None = None,distance: float = 500 ,unit: str = "m" ,release: str = OVERTURE_LATEST_RELEASE,building_part: bool=False) -> GeoDataFrame:
     """
     Retrieve buildings data from Overture in a bounding box around a specified address.
@@ -119,7 +158,7 @@ def overture_buildings_from_address(address: str | tuple[float,float],columns: l
     filters : FilterStructure | None, optional
         Filter criteria to apply to the results.
         Should be a list in the format(column,operator,value)
-        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains"
+        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains","isin","starts_with","ends_with"
     distance : float, optional
         Radius of the bounding box around the address. Defaults to 500 meters.
     unit : str, optional
@@ -153,7 +192,7 @@ def overture_buildings_from_place(address: str,columns: list[str]| None=None,fil
     filters : FilterStructure | None, optional
         Filter criteria to apply to the results.
         Should be a list in the format(column,operator,value)
-        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains"
+        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains","isin","starts_with","ends_with"
     release : str, optional
         Dataset release version to use. Defaults to the latest version.
     building_part : bool, optional
@@ -183,7 +222,7 @@ def overture_buildings_from_bbox(bbox: tuple[float,float,float,float],columns: l
     filters : FilterStructure | None, optional
         Filter criteria to apply to the results.
         Should be a list in the format(column,operator,value)
-        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains"
+        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains","isin","starts_with","ends_with"
     release : str, optional
         Dataset release version to use. Defaults to the latest version.
     building_part : bool, optional
@@ -213,7 +252,7 @@ def overture_transportation_from_address(address: str | tuple[float,float],colum
     filters : FilterStructure | None, optional
         Filter criteria to apply to the results.
         Should be a list in the format(column,operator,value)
-        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains"
+        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains","isin","starts_with","ends_with"
     distance : float, optional
         Radius of the bounding box around the address. Defaults to 500 meters.
     unit : str, optional
@@ -247,7 +286,7 @@ def overture_transportation_from_place(address: str,columns: list[str]| None=Non
     filters : FilterStructure | None, optional
         Filter criteria to apply to the results.
         Should be a list in the format(column,operator,value)
-        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains"
+        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains","isin","starts_with","ends_with"
     release : str, optional
         Dataset release version to use. Defaults to the latest version.
     connector : bool, optional
@@ -277,7 +316,7 @@ def overture_transportation_from_bbox(bbox: tuple[float,float,float,float],colum
     filters : FilterStructure | None, optional
         Filter criteria to apply to the results.
         Should be a list in the format(column,operator,value)
-        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains"
+        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains","isin","starts_with","ends_with"
     release : str, optional
         Dataset release version to use. Defaults to the latest version.
     connector : bool, optional
@@ -307,7 +346,7 @@ def overture_addresses_from_address(address: str | tuple[float,float],columns: l
     filters : FilterStructure | None, optional
         Filter criteria to apply to the results.
         Should be a list in the format(column,operator,value)
-        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains"
+        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains","isin","starts_with","ends_with"
     distance : float, optional
         Radius of the bounding box around the address. Defaults to 500 meters.
     unit : str, optional
@@ -335,7 +374,7 @@ def overture_addresses_from_place(address: str,columns: list[str]| None=None,fil
     filters : FilterStructure | None, optional
         Filter criteria to apply to the results.
         Should be a list in the format(column,operator,value)
-        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains"
+        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains","isin","starts_with","ends_with"
     release : str, optional
         Dataset release version to use. Defaults to the latest version.
         
@@ -359,7 +398,7 @@ def overture_addresses_from_bbox(bbox: tuple[float,float,float,float],columns: l
     filters : FilterStructure | None, optional
         Filter criteria to apply to the results.
         Should be a list in the format(column,operator,value)
-        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains"
+        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains","isin","starts_with","ends_with"
     release : str, optional
         Dataset release version to use. Defaults to the latest version.
         
@@ -385,7 +424,7 @@ def overture_base_from_address(address: str | tuple[float,float],base_type: str,
     filters : FilterStructure | None, optional
         Filter criteria to apply to the results.
         Should be a list in the format(column,operator,value)
-        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains"
+        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains","isin","starts_with","ends_with"
     distance : float, optional
         Radius of the bounding box around the address. Defaults to 500 meters.
     unit : str, optional
@@ -418,7 +457,7 @@ def overture_base_from_place(address: str,base_type: str,columns: list[str]| Non
     filters : FilterStructure | None, optional
         Filter criteria to apply to the results.
         Should be a list in the format(column,operator,value)
-        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains"
+        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains","isin","starts_with","ends_with"
     release : str, optional
         Dataset release version to use. Defaults to the latest version.
         
@@ -447,7 +486,7 @@ def overture_base_from_bbox(bbox: tuple[float,float,float,float],base_type: str,
     filters : FilterStructure | None, optional
         Filter criteria to apply to the results.
         Should be a list in the format(column,operator,value)
-        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains"
+        Supported operators are: "==", "!=", "<", "<=", ">", ">=","contains","isin","starts_with","ends_with"
     release : str, optional
         Dataset release version to use. Defaults to the latest version.
         
@@ -562,8 +601,6 @@ def get_schema(dataset_name : str,
         String representation of PyArrow schema of dataset
     """
     datasets = ["buildings","transportation","base","places","addresses"]
-    with resources.files("pyplaces").joinpath("releases/overture/base_types.txt").open( "r",encoding="utf-8-sig") as f:
-        base_types = [line.replace("type=", "").strip(" \n/") for line in f]
     if dataset_name not in datasets:
         raise KeyError(f"No dataset: {dataset_name} found")
     elif connector and dataset_name != "transportation":
@@ -572,10 +609,10 @@ def get_schema(dataset_name : str,
         raise KeyError("Dataset must be \"buildings\" to get building_part schema")
     elif base_type and dataset_name != "base":
         raise KeyError(f"Dataset must be \"base\" to get {base_type} schema")
-    elif base_type and base_type not in base_types:
-        raise KeyError(f"No base type:{dataset_name} found")
+    elif base_type and base_type not in _VALID_BASE_TYPES:
+        raise KeyError(f"No base type:{base_type} found")
     
-    path = OVERTURE_MAIN_PATH.format(release=release).replace("s3://", "") 
+    path = OVERTURE_MAIN_PATH.format(release=release)
     if dataset_name == "places":
         path = path + OVERTURE_PLACES_PREFIX
     elif dataset_name == "addresses":
@@ -596,6 +633,13 @@ def get_schema(dataset_name : str,
     schema = schema_from_dataset(path,OVERTURE_REGION)
     return schema.to_string()
 
+@lru_cache(maxsize=1)
+def _get_category_finder() -> CategoryFinder:
+    """Build the category finder on first use and reuse it for later searches."""
+    finder = CategoryFinder()
+    finder.load_data(get_categories())
+    return finder.process_data()
+
 def find_categories(search: str, num_results: int = 5, exact_match: bool=False,verbose: bool=False,as_df: bool= False) -> Union[list[str],DataFrame]:
     """
     Finds Overture Places categories based on a user search.
@@ -618,10 +662,7 @@ def find_categories(search: str, num_results: int = 5, exact_match: bool=False,v
     Union[list[str],Dataframe]
         Matched Overture Category names as a list of strings or DataFrame.
     """
-    finder = CategoryFinder()
-    categories = get_categories()
-    finder.load_data(categories)
-    finder.process_data()
+    finder = _get_category_finder()
     matches = finder.suggest_categories(search,num_results,exact_match,verbose,as_df,hide_ids=True,list_return="name",show_name_and_id=False)
     return matches
 
@@ -640,9 +681,7 @@ def _check_base_type(base_type):
     ValueError
         If the base type is not valid
     """   
-    with resources.files("pyplaces").joinpath("releases/overture/base_types.txt").open( "r",encoding="utf-8-sig") as f:
-        base_types = [line.replace("type=", "").strip(" \n/") for line in f]
-    if base_type not in base_types:
+    if base_type not in _VALID_BASE_TYPES:
         raise ValueError(f"Invalid base type:{base_type}")
     
 def _check_release(release):
@@ -659,16 +698,14 @@ def _check_release(release):
     ValueError
         If the release version is not valid
     """
-    with resources.files("pyplaces").joinpath("releases/overture/releases.txt").open( "r",encoding="utf-8-sig") as f:
-        folders = [line.strip(" \n/") for line in f]
-    if release not in folders:
+    if release not in _VALID_RELEASES:
         raise ValueError(f"Invalid release:{release}")
     
 
 
 __all__ = ["overture_addresses_from_address","overture_addresses_from_bbox","overture_addresses_from_place","overture_base_from_address", 
             "overture_base_from_bbox","overture_base_from_place","overture_buildings_from_address","overture_buildings_from_bbox",
-            "overture_buildings_from_place","overture_places_from_address","overture_places_from_bbox","overture_places_from_place",
+            "overture_buildings_from_place","overture_places_from_address","overture_places_from_bbox","overture_places_from_bboxes","overture_places_from_place",
             "overture_transportation_from_address","overture_transportation_from_bbox","overture_transportation_from_place","get_schema","find_categories","get_categories"]
 
 wrap_functions_with_release(__name__, _check_release,__all__)
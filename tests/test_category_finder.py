@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+from pandas import DataFrame
+
+import pyplaces._category_finder as category_finder
+from pyplaces._category_finder import CategoryFinder
+
+# Offline checks of the category search; a stub encoder stands in for the sentence-transformers model
+
+class StubEncoder:
+    """Embeds text as its normalized letter counts, and records what it was asked to encode."""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        vectors = np.zeros((len(texts), 26), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for char in text:
+                if "a" <= char <= "z":
+                    vectors[row, ord(char) - ord("a")] += 1
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+CATEGORIES = {
+    "category_id": ["1", "2", "3", "4", "5"],
+    "category_name": ["Coffee  Shop", "Coffee Roaster", "Tea Shop", "Shoe Shop", "Hardware Store"],
+    "category_level": [2, 2, 2, 2, 1],
+}
+
+@pytest.fixture
+def encoder(tmp_path, monkeypatch):
+    monkeypatch.setattr(category_finder, "CACHE_DIR", tmp_path)
+    return StubEncoder()
+
+def make_finder(encoder):
+    finder = CategoryFinder()
+    finder._semantic_model = encoder
+    return finder.load_data(DataFrame(CATEGORIES)).process_data()
+
+def test_exact_match_not_repeated(encoder):
+    # the double space is normalized away, so the query hits "Coffee  Shop" exactly
+    matches = make_finder(encoder)._find_categories("coffee shop", top_n=3, threshold=0)
+    assert matches[0]["category_id"] == "1" and matches[0]["match_type"] == "exact"
+    assert [m["category_id"] for m in matches].count("1") == 1
+    assert all(m["match_type"] == "semantic" for m in matches[1:])
+
+def test_top_n(encoder):
+    finder = make_finder(encoder)
+    for top_n in (1, 2, 4):
+        assert len(finder._find_categories("shop", top_n=top_n, threshold=0)) == top_n
+    # top_n larger than the catalogue returns every category once
+    assert len(finder._find_categories("shop", top_n=10, threshold=0)) == len(CATEGORIES["category_id"])
+
+def test_exact_match_skips_encoding(encoder):
+    finder = make_finder(encoder)
+    encoder.calls.clear()
+    assert [m["category_id"] for m in finder._find_categories("tea shop", top_n=1)] == ["3"]
+    assert [m["category_id"] for m in finder._find_categories("tea shop", top_n=5, exact_match=True)] == ["3"]
+    assert encoder.calls == []
+
+    finder._find_categories("tea shop", top_n=2, threshold=0)
+    assert encoder.calls == [["tea shop"]]
+
+def test_embeddings_cache(encoder, tmp_path):
+    first = make_finder(encoder)
+    assert len(encoder.calls) == 1
+    assert len(list(tmp_path.glob("categories_*.npz"))) == 1
+
+    second = make_finder(encoder)
+    assert len(encoder.calls) == 1
+    assert second.semantic_matrix.dtype == np.float32
+    np.testing.assert_allclose(second.semantic_matrix, first.semantic_matrix, atol=1e-3)
+
+def test_list_return_skips_dataframe(encoder, monkeypatch):
+    finder = make_finder(encoder)
+
+    def no_dataframe(*args, **kwargs):
+        raise AssertionError("list results should not build a DataFrame")
+    monkeypatch.setattr(category_finder, "DataFrame", no_dataframe)
+
+    kwargs = dict(top_n=2, exact_match=False, verbose=False, as_df=False, hide_ids=False)
+    names = finder.suggest_categories("coffee shop", list_return="name", **kwargs)
+    ids = finder.suggest_categories("coffee shop", list_return="id", **kwargs)
+    assert names[0] == "Coffee  Shop" and ids[0] == "1"
+    assert len(names) == len(ids) == 2
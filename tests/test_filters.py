@@ -0,0 +1,163 @@
+import sys
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.dataset as pads
+import pyarrow.parquet as pq
+import pytest
+from geopandas import GeoDataFrame
+from pyarrow.fs import LocalFileSystem
+from shapely import Point, Polygon, box, union_all
+
+import pyplaces._io_utils as io
+from pyplaces._geo_utils import geometry_tiles
+from pyplaces._utils import (
+    _merge_equalities, _prefix_upper_bound, compile_filter_structure,
+    evaluate_filter_structure, split_filter_structure
+)
+
+# Offline checks of the filter translation; they run on in-memory batches and small local files only
+
+BATCH = pa.record_batch({
+    "id": pa.array([1, 2, 3, 4, None], pa.int64()),
+    "name": pa.array(["New York", "Newark", "bar", "n5", None]),
+    "tags": pa.array([["a", "b"], ["c"], [], None, ["b"]], pa.list_(pa.string())),
+})
+
+def ids(batch):
+    return batch.column("id").to_pylist()
+
+def test_prefix_upper_bound():
+    assert _prefix_upper_bound("New ") == "New!"
+    assert _prefix_upper_bound("a" + chr(sys.maxunicode)) == "b"
+    assert _prefix_upper_bound(chr(sys.maxunicode)) is None
+    assert _prefix_upper_bound("") is None
+
+def test_merge_equalities():
+    merged = _merge_equalities([("id", "==", 1), ("name", "==", "bar"), ("id", "==", 3), ("id", "==", 1)])
+    assert merged == [("id", "isin", [1, 3]), ("name", "==", "bar")]
+    # a single equality, None and mixed value types are left alone
+    assert _merge_equalities([("id", "==", 1), ("id", ">", 3)]) == [("id", "==", 1), ("id", ">", 3)]
+    assert _merge_equalities([("id", "==", 1), ("id", "==", None)]) == [("id", "==", 1), ("id", "==", None)]
+    assert _merge_equalities([("id", "==", 1), ("id", "==", "1")]) == [("id", "==", 1), ("id", "==", "1")]
+
+@pytest.mark.parametrize("filters, expected", [
+    (("name", "isin", "n5"), [4]),
+    (("name", "isin", "bar"), [3]),
+    (("name", "isin", ["bar", "n5"]), [3, 4]),
+    (("id", "isin", (1, 2)), [1, 2]),
+    (("id", "isin", {1, 2}), [1, 2]),
+    (("name", "isin", frozenset({"bar", "n5"})), [3, 4]),
+    (("id", "isin", np.array([2, 3])), [2, 3]),
+    (("name", "starts_with", "New"), [1, 2]),
+    (("name", "starts_with", "New "), [1]),
+    (("name", "ends_with", "ark"), [2]),
+    (("name", "contains", ["ew", "ar"]), [1, 2, 3]),
+    ([("id", "==", 1), ("id", "==", 3)], [1, 3]),
+    ([[("id", ">", 1)], [("name", "starts_with", "N"), ("name", "==", "bar")]], [2, 3]),
+])
+def test_evaluate_filter_structure(filters, expected):
+    assert ids(evaluate_filter_structure(BATCH, filters)) == expected
+
+def test_contains_on_list_column():
+    assert ids(evaluate_filter_structure(BATCH, ("tags", "contains", "b"))) == [1, None]
+    assert ids(evaluate_filter_structure(BATCH, ("tags", "contains", ["c", "z"]))) == [2]
+    # a value that can never be a list element matches nothing instead of raising
+    assert ids(evaluate_filter_structure(BATCH, ("tags", "contains", 1))) == []
+    # unhashable values cannot key the value-set cache, but still match nothing
+    assert ids(evaluate_filter_structure(BATCH, ("tags", "contains", [["a"]]))) == []
+
+def test_invalid_filter_structures():
+    with pytest.raises(ValueError):
+        compile_filter_structure([], BATCH.schema)
+    with pytest.raises(ValueError):
+        compile_filter_structure([("id", "==", 1), "id"], BATCH.schema)
+
+def test_empty_batch():
+    empty = BATCH.slice(0, 0)
+    assert evaluate_filter_structure(empty, [("id", "==", 1), ("id", "==", 2)]).num_rows == 0
+
+def test_split_filter_structure():
+    expr, residual = split_filter_structure([("id", "==", 1), ("id", "==", 3)], BATCH.schema)
+    assert residual is None
+    assert "is_in" in str(expr)
+
+    expr, residual = split_filter_structure(("name", "starts_with", "New "), BATCH.schema)
+    assert residual is None
+    assert '(name >= "New ")' in str(expr) and '(name < "New!")' in str(expr)
+
+    # list membership cannot be expressed, so it stays residual while the rest is pushed down
+    expr, residual = split_filter_structure([[("id", ">", 1)], [("tags", "contains", "b")]], BATCH.schema)
+    assert str(expr) == "(id > 1)"
+    assert residual == [[("tags", "contains", "b")]]
+
+def test_split_filter_structure_unknown_columns():
+    nested = pa.schema([("names", pa.struct([("primary", pa.string())])), ("id", pa.int64())])
+    for col in ("names.nope", "id.x", "missing"):
+        with pytest.raises(KeyError, match=f'"{col}"'):
+            split_filter_structure((col, "==", "x"), nested)
+    expr, residual = split_filter_structure(("names.primary", "==", "x"), nested)
+    assert residual is None and "primary" in str(expr)
+
+@pytest.mark.parametrize("filters", [
+    ("name", "isin", "n5"),
+    ("id", "isin", None),
+    ("name", "isin", {"n5", "bar"}),
+    ("name", "starts_with", "New"),
+    ("name", "ends_with", "ark"),
+    [("id", "==", 1), ("id", "==", 3), ("name", "==", "n5")],
+    [[("id", "<", 4)], [("tags", "contains", "b"), ("name", "contains", "ew")]],
+])
+def test_pushdown_matches_in_memory(tmp_path, filters):
+    pq.write_table(pa.Table.from_batches([BATCH]), tmp_path / "data.parquet")
+    dataset = pads.dataset(tmp_path / "data.parquet")
+
+    expr, residual = split_filter_structure(filters, dataset.schema)
+    table = dataset.to_table(filter=expr)
+    if residual:
+        table = table.filter(compile_filter_structure(residual, table.schema)(table.combine_chunks().to_batches()[0]))
+
+    assert sorted(table.column("id").to_pylist(), key=str) == sorted(ids(evaluate_filter_structure(BATCH, filters)), key=str)
+
+def test_geometry_tiles():
+    place = Polygon([(0, 0), (4, 0), (4, 1), (1, 1), (1, 4), (0, 4)])
+    tiles = geometry_tiles(place, grid_size=4)
+    covering = union_all([box(*tile) for tile in tiles])
+    assert covering.covers(place)
+    # an L-shaped place leaves the empty corner of its bounds out
+    assert covering.area < box(*place.bounds).area
+
+    assert geometry_tiles(Point(1, 2)) == [(1.0, 2.0, 1.0, 2.0)]
+
+@pytest.fixture
+def local_geoparquet(tmp_path, monkeypatch):
+    points = [Point(x, y) for x in range(4) for y in range(4)]
+    gdf = GeoDataFrame({"id": [f"n{i}" for i in range(len(points))]}, geometry=points, crs="EPSG:4326")
+    gdf.to_parquet(tmp_path / "places.parquet", write_covering_bbox=True)
+
+    # read through the package's dataset helpers, but from the local disk
+    monkeypatch.setattr(io, "_s3_filesystem", lambda region: LocalFileSystem())
+    io._open_dataset.cache_clear()
+    io._geo_metadata.cache_clear()
+    yield str(tmp_path / "places.parquet")
+    io._open_dataset.cache_clear()
+    io._geo_metadata.cache_clear()
+
+def test_read_geoparquet_isin(local_geoparquet):
+    result = io.read_geoparquet_arrow(local_geoparquet, "local", (-1, -1, 5, 5), columns=["id"],
+                                    filters=("id", "isin", "n5"))
+    assert result["id"].tolist() == ["n5"]
+
+@pytest.mark.parametrize("return_arrow", [False, True])
+def test_from_place_without_geometry_column(local_geoparquet, monkeypatch, return_arrow):
+    place = box(0.5, 0.5, 2.5, 2.5)
+    monkeypatch.setattr(io, "geocode_place_to_bbox", lambda address: (place, place.bounds))
+
+    result = io.from_place("place", "", local_geoparquet, "local", "", columns=["id"], return_arrow=return_arrow)
+    result_ids = result.column("id").to_pylist() if return_arrow else result["id"].tolist()
+    assert list(result.column_names if return_arrow else result.columns) == ["id"]
+    assert sorted(result_ids) == ["n10", "n5", "n6", "n9"]
+
+def test_from_bboxes_requires_bboxes():
+    with pytest.raises(ValueError):
+        io.from_bboxes([], "", "", "local", "")